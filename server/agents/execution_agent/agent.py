@@ -32,6 +32,9 @@ Be thorough, accurate, and efficient in your execution."""
 class ExecutionAgent:
     """Manages state and history for an execution agent."""
 
+    ARGUMENTS_PREVIEW_LENGTH = 200
+    RESULT_PREVIEW_LENGTH = 500
+
     # Initialize execution agent with name, conversation limits, and log store access
     def __init__(
         self,
@@ -118,6 +121,6 @@ class ExecutionAgent:
     # Log tool invocation and results with truncated content for readability
     def record_tool_execution(self, tool_name: str, arguments: str, result: str) -> None:
         """Record tool execution details."""
-        self._log_store.record_action(self.name, f"Calling {tool_name} with: {arguments[:200]}")
+        self._log_store.record_action(self.name, f"Calling {tool_name} with: {arguments[:self.ARGUMENTS_PREVIEW_LENGTH]}")
         # Record the tool response
-        self._log_store.record_tool_response(self.name, tool_name, result[:500])
+        self._log_store.record_tool_response(self.name, tool_name, result[:self.RESULT_PREVIEW_LENGTH])
@@ -6,10 +6,14 @@ import asyncio
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from .runtime import ExecutionAgentRuntime, ExecutionResult
 from ...logging_config import logger
+from ...openrouter_client import close_http_client
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..interaction_agent.runtime import InteractionAgentRuntime
 
 
 @dataclass
@@ -58,16 +62,16 @@ class ExecutionBatchManager:
         batch_id = await self._register_pending_execution(agent_name, instructions, request_id)
 
         try:
-            logger.info(f"[{agent_name}] Execution started")
+            logger.info("[%s] Execution started", agent_name)
             runtime = ExecutionAgentRuntime(agent_name=agent_name)
             result = await asyncio.wait_for(
                 runtime.execute(instructions),
                 timeout=self.timeout_seconds,
             )
             status = "SUCCESS" if result.success else "FAILED"
-            logger.info(f"[{agent_name}] Execution finished: {status}")
+            logger.info("[%s] Execution finished: %s", agent_name, status)
         except asyncio.TimeoutError:
-            logger.error(f"[{agent_name}] Execution timed out after {self.timeout_seconds}s")
+            logger.error("[%s] Execution timed out after %ss", agent_name, self.timeout_seconds)
             result = ExecutionResult(
                 agent_name=agent_name,
                 success=False,
@@ -75,7 +79,7 @@ class ExecutionBatchManager:
                 error="Timeout",
             )
         except Exception as exc:  # pragma: no cover - defensive
-            logger.exception(f"[{agent_name}] Execution failed unexpectedly")
+            logger.exception("[%s] Execution failed unexpectedly", agent_name)
             result = ExecutionResult(
                 agent_name=agent_name,
                 success=False,
@@ -128,7 +132,7 @@ class ExecutionBatchManager:
         async with self._batch_lock:
             state = self._batch_state
             if state is None or state.batch_id != batch_id:
-                logger.warning(f"[{agent_name}] Dropping result for unknown batch")
+                logger.warning("[%s] Dropping result for unknown batch", agent_name)
                 return
 
             state.results.append(result)
@@ -137,7 +141,7 @@ class ExecutionBatchManager:
             if state.pending == 0:
                 dispatch_payload = self._format_batch_payload(state.results)
                 agent_names = [entry.agent_name for entry in state.results]
-                logger.info(f"Execution batch completed: {', '.join(agent_names)}")
+                logger.info("Execution batch completed: %s", ", ".join(agent_names))
                 self._batch_state = None
 
         if dispatch_payload:
@@ -177,17 +181,25 @@ class ExecutionBatchManager:
             entries.append(f"[{status}] {result.agent_name}: {response_text}")
         return "\n".join(entries)
 
+    # Run one interaction turn on a throwaway loop, closing the HTTP client bound to it
+    @staticmethod
+    async def _handle_agent_message_once(runtime: InteractionAgentRuntime, payload: str) -> None:
+        try:
+            await runtime.handle_agent_message(payload)
+        finally:
+            await close_http_client()
+
     # Forward combined execution results to interaction agent for user response generation
     async def _dispatch_to_interaction_agent(self, payload: str) -> None:
         """Send the aggregated execution summary to the interaction agent."""
 
-        from ..interaction_agent.runtime import InteractionAgentRuntime
+        from ..interaction_agent.runtime import get_interaction_agent_runtime
 
-        runtime = InteractionAgentRuntime()
+        runtime = get_interaction_agent_runtime()
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
-            asyncio.run(runtime.handle_agent_message(payload))
+            asyncio.run(self._handle_agent_message_once(runtime, payload))
             return
 
         loop.create_task(runtime.handle_agent_message(payload))
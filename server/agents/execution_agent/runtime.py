@@ -1,15 +1,17 @@
 """Simplified Execution Agent Runtime."""
 
+import asyncio
 import inspect
 import json
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 from .agent import ExecutionAgent
-from .tools import get_tool_schemas, get_tool_registry
+from .tools import get_tool_schemas, get_tool_schemas_json, get_tool_registry
 from ...config import get_settings
 from ...openrouter_client import request_chat_completion
 from ...logging_config import logger
+from ...utils.json_utils import safe_json_dump
 
 
 @dataclass
@@ -26,6 +28,19 @@ class ExecutionAgentRuntime:
     """Manages the execution of a single agent request."""
 
     MAX_TOOL_ITERATIONS = 8
+    MAX_PARALLEL_TOOLS = 4
+    # Tools that change trigger or Gmail state; a turn containing one runs its calls in order
+    MUTATING_TOOLS = frozenset(
+        {
+            "createTrigger",
+            "updateTrigger",
+            "gmail_create_draft",
+            "gmail_execute_draft",
+            "gmail_delete_draft",
+            "gmail_forward_email",
+            "gmail_reply_to_thread",
+        }
+    )
 
     # Initialize execution agent runtime with settings, tools, and agent instance
     def __init__(self, agent_name: str):
@@ -35,6 +50,8 @@ class ExecutionAgentRuntime:
         self.model = settings.execution_agent_model
         self.tool_registry = get_tool_registry(agent_name=agent_name)
         self.tool_schemas = get_tool_schemas()
+        self.tool_schemas_json = get_tool_schemas_json()
+        self._tool_semaphore = asyncio.Semaphore(self.MAX_PARALLEL_TOOLS)
 
         if not self.api_key:
             raise ValueError("OpenRouter API key not configured. Set OPENROUTER_API_KEY environment variable.")
@@ -53,7 +70,7 @@ class ExecutionAgentRuntime:
 
             for iteration in range(self.MAX_TOOL_ITERATIONS):
                 logger.info(
-                    f"[{self.agent.name}] Requesting plan (iteration {iteration + 1})"
+                    "[%s] Requesting plan (iteration %d)", self.agent.name, iteration + 1
                 )
                 response = await self._make_llm_call(system_prompt, messages, with_tools=True)
                 assistant_message = response.get("choices", [{}])[0].get("message", {})
@@ -76,6 +93,9 @@ class ExecutionAgentRuntime:
                     final_response = assistant_entry["content"] or "No action required."
                     break
 
+                executable = [call for call in parsed_tool_calls if call.get("name")]
+                outcomes = iter(await self._run_tool_calls(executable))
+
                 for tool_call in parsed_tool_calls:
                     tool_name = tool_call.get("name", "")
                     tool_args = tool_call.get("arguments", {})
@@ -95,21 +115,21 @@ class ExecutionAgentRuntime:
                         continue
 
                     tools_executed.append(tool_name)
-                    logger.info(f"[{self.agent.name}] Executing tool: {tool_name}")
-
-                    success, result = await self._execute_tool(tool_name, tool_args)
+                    success, result = next(outcomes)
 
                     if success:
-                        logger.info(f"[{self.agent.name}] Tool {tool_name} completed successfully")
-                        record_payload = self._safe_json_dump(result)
+                        logger.info("[%s] Tool %s completed successfully", self.agent.name, tool_name)
+                        record_payload = self._safe_json_preview(
+                            result, self.agent.RESULT_PREVIEW_LENGTH
+                        )
                     else:
                         error_detail = result.get("error") if isinstance(result, dict) else str(result)
-                        logger.warning(f"[{self.agent.name}] Tool {tool_name} failed: {error_detail}")
+                        logger.warning("[%s] Tool %s failed: %s", self.agent.name, tool_name, error_detail)
                         record_payload = error_detail
 
                     self.agent.record_tool_execution(
                         tool_name,
-                        self._safe_json_dump(tool_args),
+                        self._safe_json_preview(tool_args, self.agent.ARGUMENTS_PREVIEW_LENGTH),
                         record_payload
                     )
 
@@ -136,7 +156,7 @@ class ExecutionAgentRuntime:
             )
 
         except Exception as e:
-            logger.error(f"[{self.agent.name}] Execution failed: {e}")
+            logger.error("[%s] Execution failed: %s", self.agent.name, e)
             error_msg = str(e)
             failure_text = f"Failed to complete task: {error_msg}"
             self.agent.record_response(f"Error: {error_msg}")
@@ -151,14 +171,16 @@ class ExecutionAgentRuntime:
     # Execute OpenRouter API call with system prompt, messages, and optional tool schemas
     async def _make_llm_call(self, system_prompt: str, messages: List[Dict], with_tools: bool) -> Dict:
         """Make an LLM call."""
-        tools_to_send = self.tool_schemas if with_tools else None
-        logger.info(f"[{self.agent.name}] Calling LLM with model: {self.model}, tools: {len(tools_to_send) if tools_to_send else 0}")
+        tool_count = len(self.tool_schemas) if with_tools else 0
+        logger.info(
+            "[%s] Calling LLM with model: %s, tools: %d", self.agent.name, self.model, tool_count
+        )
         return await request_chat_completion(
             model=self.model,
             messages=messages,
             system=system_prompt,
             api_key=self.api_key,
-            tools=tools_to_send
+            tools_json=self.tool_schemas_json if with_tools else None,
         )
 
     # Parse and validate tool calls from LLM response into structured format
@@ -186,13 +208,9 @@ class ExecutionAgentRuntime:
 
         return tool_calls
 
-    # Safely convert objects to JSON with fallback to string representation
-    def _safe_json_dump(self, payload: Any) -> str:
-        """Serialize payload to JSON, falling back to string representation."""
-        try:
-            return json.dumps(payload, default=str)
-        except TypeError:
-            return str(payload)
+    # Serialize a payload for the execution log, keeping only the preview length
+    def _safe_json_preview(self, payload: Any, limit: int) -> str:
+        return safe_json_dump(payload)[:limit]
 
     # Format tool execution results into JSON structure for LLM consumption
     def _format_tool_result(
@@ -218,7 +236,30 @@ class ExecutionAgentRuntime:
                 "arguments": arguments,
                 "error": error_detail,
             }
-        return self._safe_json_dump(payload)
+        return safe_json_dump(payload)
+
+    # Run a turn's tool calls, concurrently unless one of them mutates shared state
+    async def _run_tool_calls(self, calls: List[Dict[str, Any]]) -> List[Tuple[bool, Any]]:
+        """Execute tool calls and return their outcomes in call order.
+
+        Read-only calls are independent and run concurrently. If any call mutates
+        triggers or drafts, the whole turn runs sequentially so a follow-up read
+        (e.g. createTrigger then listTriggers) sees the write.
+        """
+        if any(call["name"] in self.MUTATING_TOOLS for call in calls):
+            outcomes: List[Tuple[bool, Any]] = []
+            for call in calls:
+                logger.info("[%s] Executing tool: %s", self.agent.name, call["name"])
+                outcomes.append(await self._execute_tool(call["name"], call.get("arguments", {})))
+            return outcomes
+
+        for call in calls:
+            logger.info("[%s] Executing tool: %s", self.agent.name, call["name"])
+        return list(
+            await asyncio.gather(
+                *(self._execute_tool(call["name"], call.get("arguments", {})) for call in calls)
+            )
+        )
 
     # Execute tool function from registry with error handling and async support
     async def _execute_tool(self, tool_name: str, arguments: Dict) -> Tuple[bool, Any]:
@@ -228,9 +269,14 @@ class ExecutionAgentRuntime:
             return False, {"error": f"Unknown tool: {tool_name}"}
 
         try:
-            result = tool_func(**arguments)
-            if inspect.isawaitable(result):
-                result = await result
+            async with self._tool_semaphore:
+                if inspect.iscoroutinefunction(tool_func):
+                    result = await tool_func(**arguments)
+                else:
+                    # Blocking tools (Composio, SQLite) run off the event loop
+                    result = await asyncio.to_thread(tool_func, **arguments)
+                    if inspect.isawaitable(result):
+                        result = await result
             return True, result
         except Exception as e:
             return False, {"error": str(e)}
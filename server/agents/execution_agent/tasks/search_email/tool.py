@@ -92,22 +92,22 @@ def build_registry(agent_name: str) -> Dict[str, Callable[..., Any]]:  # noqa: A
 # Run an agentic Gmail search for the provided query
 async def task_email_search(search_query: str) -> Any:
     """Run an agentic Gmail search for the provided query."""
-    logger.info(f"[EMAIL_SEARCH] Starting search for: '{search_query}'")
+    logger.info("[EMAIL_SEARCH] Starting search for: '%s'", search_query)
     
     # Validate inputs
     cleaned_query = (search_query or "").strip()
     if error := _validate_search_query(cleaned_query):
-        logger.error(f"[EMAIL_SEARCH] Invalid query: {error}")
+        logger.error("[EMAIL_SEARCH] Invalid query: %s", error)
         return {"error": error}
     
     composio_user_id = _validate_gmail_connection()
     if not composio_user_id:
-        logger.error(f"[EMAIL_SEARCH] Gmail not connected")
+        logger.error("[EMAIL_SEARCH] Gmail not connected")
         return {"error": ERROR_GMAIL_NOT_CONNECTED}
     
     api_key, model_or_error = _validate_openrouter_config()
     if not api_key:
-        logger.error(f"[EMAIL_SEARCH] OpenRouter not configured: {model_or_error}")
+        logger.error("[EMAIL_SEARCH] OpenRouter not configured: %s", model_or_error)
         return {"error": model_or_error}
     
     try:
@@ -117,10 +117,10 @@ async def task_email_search(search_query: str) -> Any:
             model=model_or_error,
             api_key=api_key,
         )
-        logger.info(f"[EMAIL_SEARCH] Found {len(result) if isinstance(result, list) else 0} emails")
+        logger.info("[EMAIL_SEARCH] Found %d emails", len(result) if isinstance(result, list) else 0)
         return result
     except Exception as exc:  # pragma: no cover - defensive
-        logger.exception(f"[EMAIL_SEARCH] Search failed: {exc}")
+        logger.exception("[EMAIL_SEARCH] Search failed: %s", exc)
         return {"error": f"Email search failed: {exc}"}
 
 
@@ -170,7 +170,7 @@ async def _run_email_search(
         
         # Handle case where LLM doesn't make tool calls
         if not tool_calls:
-            logger.info(f"[EMAIL_SEARCH] LLM completed search - no more queries needed")
+            logger.info("[EMAIL_SEARCH] LLM completed search - no more queries needed")
             selected_ids = []
             break
         
@@ -192,16 +192,20 @@ async def _run_email_search(
         
         # Check if search is complete
         if completed_ids is not None:
-            logger.info(f"[EMAIL_SEARCH] Search completed - selected {len(completed_ids)} emails")
+            logger.info("[EMAIL_SEARCH] Search completed - selected %d emails", len(completed_ids))
             selected_ids = completed_ids
             break
     else:
-        logger.error(f"[EMAIL_SEARCH] {ERROR_ITERATION_LIMIT}")
+        logger.error("[EMAIL_SEARCH] %s", ERROR_ITERATION_LIMIT)
         raise RuntimeError(ERROR_ITERATION_LIMIT)
     
     final_result = _build_response(queries, emails, selected_ids or [])
     unique_queries = list(dict.fromkeys(queries))
-    logger.info(f"[EMAIL_SEARCH] Completed - {len(unique_queries)} queries executed, {len(final_result)} emails selected")
+    logger.info(
+        "[EMAIL_SEARCH] Completed - %d queries executed, %d emails selected",
+        len(unique_queries),
+        len(final_result),
+    )
     return final_result
 
 
@@ -234,7 +238,7 @@ async def _execute_tool_calls(
         if parse_error:
             # Handle argument parsing errors
             query = arguments.get("query") if arguments else None
-            logger.warning(f"[EMAIL_SEARCH] Tool argument parsing failed: {parse_error}")
+            logger.warning("[EMAIL_SEARCH] Tool argument parsing failed: %s", parse_error)
             responses.append(_create_error_response(call_id, query, parse_error))
 
         elif name == COMPLETE_TOOL_NAME:
@@ -242,14 +246,14 @@ async def _execute_tool_calls(
             completion_ids_candidate, response_data = _handle_completion_tool(arguments)
             responses.append(_create_success_response(call_id, response_data))
             if completion_ids_candidate is not None:
-                logger.info(f"[EMAIL_SEARCH] LLM selected {len(completion_ids_candidate)} emails")
+                logger.info("[EMAIL_SEARCH] LLM selected %d emails", len(completion_ids_candidate))
                 completion_ids = completion_ids_candidate
                 break
 
         elif name == SEARCH_TOOL_NAME:
             # Handle Gmail search tool
             search_query = arguments.get("query", "<unknown>")
-            logger.info(f"[SEARCH_QUERY] LLM generated query: '{search_query}'")
+            logger.info("[SEARCH_QUERY] LLM generated query: '%s'", search_query)
             
             result_model = await _perform_search(
                 arguments=arguments,
@@ -261,9 +265,11 @@ async def _execute_tool_calls(
             
             if result_model.status == "success":
                 count = result_model.result_count or 0
-                logger.info(f"[SEARCH_RESULT] Query '{search_query}' → {count} emails found")
+                logger.info("[SEARCH_RESULT] Query '%s' → %d emails found", search_query, count)
             else:
-                logger.warning(f"[SEARCH_RESULT] Query '{search_query}' → FAILED: {result_model.error}")
+                logger.warning(
+                    "[SEARCH_RESULT] Query '%s' → FAILED: %s", search_query, result_model.error
+                )
             
             responses.append(_create_success_response(call_id, response_data))
 
@@ -271,7 +277,7 @@ async def _execute_tool_calls(
             # Handle unsupported tools
             query = arguments.get("query")
             error = f"Unsupported tool: {name}"
-            logger.warning(f"[EMAIL_SEARCH] Unsupported tool: {name}")
+            logger.warning("[EMAIL_SEARCH] Unsupported tool: %s", name)
             responses.append(_create_error_response(call_id, query, error))
 
     return responses, completion_ids
@@ -287,7 +293,7 @@ async def _perform_search(
 ) -> EmailSearchToolResult:
     query = (arguments.get("query") or "").strip()
     if not query:
-        logger.warning(f"[EMAIL_SEARCH] Search called with empty query")
+        logger.warning("[EMAIL_SEARCH] Search called with empty query")
         return EmailSearchToolResult(
             status="error",
             error=ERROR_QUERY_REQUIRED,
@@ -318,7 +324,7 @@ async def _perform_search(
             arguments=composio_arguments,
         )
     except Exception as exc:
-        logger.error(f"[EMAIL_SEARCH] Gmail API failed for '{query}': {exc}")
+        logger.error("[EMAIL_SEARCH] Gmail API failed for '%s': %s", query, exc)
         return EmailSearchToolResult(
             status="error",
             query=query,
@@ -363,7 +369,7 @@ def _build_response(
     # Log any missing email IDs
     missing_ids = [id for id in unique_ids if id not in emails]
     if missing_ids:
-        logger.warning(f"[EMAIL_SEARCH] {len(missing_ids)} selected email IDs not found")
+        logger.warning("[EMAIL_SEARCH] %d selected email IDs not found", len(missing_ids))
     
     payload = TaskEmailSearchPayload(emails=selected_emails)
     
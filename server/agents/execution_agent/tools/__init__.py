@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from .registry import get_tool_registry, get_tool_schemas
+from .registry import get_tool_registry, get_tool_schemas, get_tool_schemas_json
 
 __all__ = [
     "get_tool_registry",
     "get_tool_schemas",
+    "get_tool_schemas_json",
 ]
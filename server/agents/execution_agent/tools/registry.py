@@ -4,19 +4,32 @@ from __future__ import annotations
 
 from typing import Any, Callable, Dict, List
 
+import orjson
+
 from . import gmail, triggers
 from ..tasks import get_task_registry, get_task_schemas
 
+# Tool schemas are static, so the catalog and its JSON encoding are built once
+_TOOL_SCHEMAS: List[Dict[str, Any]] = [
+    *gmail.get_schemas(),
+    *get_task_schemas(),
+    *triggers.get_schemas(),
+]
+_TOOL_SCHEMAS_JSON: bytes = orjson.dumps(_TOOL_SCHEMAS)
+
 
 # Return OpenAI/OpenRouter-compatible tool schemas
 def get_tool_schemas() -> List[Dict[str, Any]]:
     """Return OpenAI/OpenRouter-compatible tool schemas."""
 
-    return [
-        *gmail.get_schemas(),
-        *get_task_schemas(),
-        *triggers.get_schemas(),
-    ]
+    return _TOOL_SCHEMAS
+
+
+# Return the tool schemas pre-serialized for request bodies
+def get_tool_schemas_json() -> bytes:
+    """Return the tool schemas as a pre-encoded JSON array."""
+
+    return _TOOL_SCHEMAS_JSON
 
 
 # Return Python callables for executing tools by name
@@ -33,4 +46,5 @@ def get_tool_registry(agent_name: str) -> Dict[str, Callable[..., Any]]:
 __all__ = [
     "get_tool_registry",
     "get_tool_schemas",
+    "get_tool_schemas_json",
 ]
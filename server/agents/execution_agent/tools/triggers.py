@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import json
-from functools import partial
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Optional
 
 from server.services.execution import get_execution_agent_logs
@@ -101,20 +100,27 @@ def get_schemas() -> List[Dict[str, Any]]:
     return _SCHEMAS
 
 
-# Convert TriggerRecord to dictionary payload for API responses
+_OPTIONAL_EXPORT_FIELDS = (
+    "start_time",
+    "next_trigger",
+    "recurrence_rule",
+    "timezone",
+    "last_error",
+    "created_at",
+    "updated_at",
+)
+_get_optional_export_fields = attrgetter(*_OPTIONAL_EXPORT_FIELDS)
+
+
+# Convert TriggerRecord to dictionary payload for API responses; unset fields stay explicit nulls
 def _trigger_record_to_payload(record: TriggerRecord) -> Dict[str, Any]:
-    return {
+    exported: Dict[str, Any] = {
         "id": record.id,
         "payload": record.payload,
-        "start_time": record.start_time,
-        "next_trigger": record.next_trigger,
-        "recurrence_rule": record.recurrence_rule,
-        "timezone": record.timezone,
         "status": record.status,
-        "last_error": record.last_error,
-        "created_at": record.created_at,
-        "updated_at": record.updated_at,
     }
+    exported.update(zip(_OPTIONAL_EXPORT_FIELDS, _get_optional_export_fields(record)))
+    return exported
 
 
 # Create a new trigger for the specified execution agent
@@ -127,12 +133,6 @@ def _create_trigger_tool(
     status: Optional[str] = None,
 ) -> Dict[str, Any]:
     timezone_value = get_timezone_store().get_timezone()
-    summary_args = {
-        "recurrence_rule": recurrence_rule,
-        "start_time": start_time,
-        "timezone": timezone_value,
-        "status": status,
-    }
     try:
         record = _TRIGGER_SERVICE.create_trigger(
             agent_name=agent_name,
@@ -145,7 +145,10 @@ def _create_trigger_tool(
     except Exception as exc:  # pragma: no cover - defensive
         _LOG_STORE.record_action(
             agent_name,
-            description=f"createTrigger failed | details={json.dumps(summary_args, ensure_ascii=False)} | error={exc}",
+            description=(
+                f"createTrigger failed | rrule={recurrence_rule} start={start_time}"
+                f" tz={timezone_value} status={status} | error={exc}"
+            ),
         )
         return {"error": str(exc)}
 
@@ -217,7 +220,7 @@ def _update_trigger_tool(
 # List all triggers belonging to this execution agent
 def _list_triggers_tool(*, agent_name: str) -> Dict[str, Any]:
     try:
-        records = _TRIGGER_SERVICE.list_triggers(agent_name=agent_name)
+        records = _TRIGGER_SERVICE.list_triggers(agent_name=agent_name, limit=None)
     except Exception as exc:  # pragma: no cover - defensive
         _LOG_STORE.record_action(
             agent_name,
@@ -232,14 +235,39 @@ def _list_triggers_tool(*, agent_name: str) -> Dict[str, Any]:
     return {"triggers": [_trigger_record_to_payload(record) for record in records]}
 
 
+class _TriggerTools:
+    """Trigger tool callables bound to a single execution agent."""
+
+    __slots__ = ("agent_name",)
+
+    def __init__(self, agent_name: str) -> None:
+        self.agent_name = agent_name
+
+    def create(self, **kwargs: Any) -> Dict[str, Any]:
+        return _create_trigger_tool(agent_name=self.agent_name, **kwargs)
+
+    def update(self, **kwargs: Any) -> Dict[str, Any]:
+        return _update_trigger_tool(agent_name=self.agent_name, **kwargs)
+
+    def list(self) -> Dict[str, Any]:
+        return _list_triggers_tool(agent_name=self.agent_name)
+
+
+_BINDINGS: Dict[str, _TriggerTools] = {}
+
+
 # Return trigger tool callables bound to a specific agent
 def build_registry(agent_name: str) -> Dict[str, Callable[..., Any]]:
     """Return trigger tool callables bound to a specific agent."""
 
+    bindings = _BINDINGS.get(agent_name)
+    if bindings is None:
+        bindings = _BINDINGS.setdefault(agent_name, _TriggerTools(agent_name))
+
     return {
-        "createTrigger": partial(_create_trigger_tool, agent_name=agent_name),
-        "updateTrigger": partial(_update_trigger_tool, agent_name=agent_name),
-        "listTriggers": partial(_list_triggers_tool, agent_name=agent_name),
+        "createTrigger": bindings.create,
+        "updateTrigger": bindings.update,
+        "listTriggers": bindings.list,
     }
 
 
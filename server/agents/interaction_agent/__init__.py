@@ -4,15 +4,17 @@ from .agent import (
     build_system_prompt,
     prepare_message_with_history,
 )
-from .runtime import InteractionAgentRuntime, InteractionResult
-from .tools import ToolResult, get_tool_schemas, handle_tool_call
+from .runtime import InteractionAgentRuntime, InteractionResult, get_interaction_agent_runtime
+from .tools import ToolResult, get_tool_schemas, get_tool_schemas_json, handle_tool_call
 
 __all__ = [
     "InteractionAgentRuntime",
     "InteractionResult",
+    "get_interaction_agent_runtime",
     "build_system_prompt",
     "prepare_message_with_history",
     "ToolResult",
     "get_tool_schemas",
+    "get_tool_schemas_json",
     "handle_tool_call",
 ]
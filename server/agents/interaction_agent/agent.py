@@ -2,7 +2,7 @@
 
 from html import escape
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from ...services.execution import get_agent_roster
 from ...services.user_profile import get_user_profile
@@ -10,13 +10,27 @@ from ...services.user_profile import get_user_profile
 _prompt_path = Path(__file__).parent / "system_prompt.md"
 SYSTEM_PROMPT = _prompt_path.read_text(encoding="utf-8").strip()
 
+# Assembled prompt keyed by the profile version it was rendered from
+_prompt_cache: Optional[Tuple[int, str]] = None
+
 
 # Load and return the pre-defined system prompt from markdown file with user profile
 def build_system_prompt() -> str:
     """Return the system prompt for the interaction agent with user profile information."""
+    global _prompt_cache
     profile_store = get_user_profile()
-    profile = profile_store.load()
+    version = profile_store.version
+    cached = _prompt_cache
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    prompt = _render_system_prompt(profile_store.load())
+    _prompt_cache = (version, prompt)
+    return prompt
+
 
+# Append the user's profile details to the base system prompt
+def _render_system_prompt(profile: Dict[str, str]) -> str:
     user_context = []
     if profile.get("userName"):
         user_context.append(f"- User's name: {profile['userName']}")
@@ -39,11 +53,18 @@ def prepare_message_with_history(
     message_type: str = "user",
 ) -> List[Dict[str, str]]:
     """Compose a message that bundles history, roster, and the latest turn."""
+    current_turn = _render_current_turn(latest_text, message_type)
+    agents = _load_active_agents()
+
+    # First turns carry no context, so send the bare turn without empty sections
+    if not transcript.strip() and not agents:
+        return [{"role": "user", "content": current_turn}]
+
     sections: List[str] = []
 
     sections.append(_render_conversation_history(transcript))
-    sections.append(f"<active_agents>\n{_render_active_agents()}\n</active_agents>")
-    sections.append(_render_current_turn(latest_text, message_type))
+    sections.append(f"<active_agents>\n{_render_active_agents(agents)}\n</active_agents>")
+    sections.append(current_turn)
 
     content = "\n\n".join(sections)
     return [{"role": "user", "content": content}]
@@ -57,18 +78,29 @@ def _render_conversation_history(transcript: str) -> str:
     return f"<conversation_history>\n{history}\n</conversation_history>"
 
 
-# Format currently active execution agents into XML tags for LLM awareness
-def _render_active_agents() -> str:
+# Read the current execution agent roster from disk
+def _load_active_agents() -> List[str]:
     roster = get_agent_roster()
-    roster.load()
-    agents = roster.get_agents()
+    roster.ensure_loaded()
+    return roster.get_agents()
+
+
+# Agent names are stable across turns, so escape each one only once
+_ESCAPED_AGENT_NAMES: Dict[str, str] = {}
 
+
+# Format currently active execution agents into XML tags for LLM awareness
+def _render_active_agents(agents: List[str]) -> str:
     if not agents:
         return "None"
 
     rendered: List[str] = []
     for agent_name in agents:
-        name = escape(agent_name or "agent", quote=True)
+        name = _ESCAPED_AGENT_NAMES.get(agent_name)
+        if name is None:
+            name = _ESCAPED_AGENT_NAMES.setdefault(
+                agent_name, escape(agent_name or "agent", quote=True)
+            )
         rendered.append(f'<agent name="{name}" />')
 
     return "\n".join(rendered)
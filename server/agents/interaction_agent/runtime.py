@@ -1,18 +1,21 @@
 """Interaction Agent Runtime - handles LLM calls for user and agent turns."""
 
-import json
+import logging
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import orjson
 
 from .agent import build_system_prompt, prepare_message_with_history
-from .tools import ToolResult, get_tool_schemas, handle_tool_call
+from .tools import ToolResult, get_tool_schemas, get_tool_schemas_json, handle_tool_call
 from ...config import get_settings
 from ...services.conversation import get_conversation_log, get_working_memory_log
 from ...openrouter_client import request_chat_completion
 from ...logging_config import logger
+from ...utils.json_utils import safe_json_dump
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InteractionResult:
     """Result from the interaction agent."""
 
@@ -22,7 +25,7 @@ class InteractionResult:
     execution_agents_used: int = 0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _ToolCall:
     """Parsed tool invocation from an LLM response."""
 
@@ -31,7 +34,7 @@ class _ToolCall:
     arguments: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class _LoopSummary:
     """Aggregate information produced by the interaction loop."""
 
@@ -55,6 +58,7 @@ class InteractionAgentRuntime:
         self.conversation_log = get_conversation_log()
         self.working_memory_log = get_working_memory_log()
         self.tool_schemas = get_tool_schemas()
+        self.tool_schemas_json = get_tool_schemas_json()
 
         if not self.api_key:
             raise ValueError(
@@ -65,51 +69,48 @@ class InteractionAgentRuntime:
     async def execute(self, user_message: str) -> InteractionResult:
         """Handle a user-authored message."""
 
-        try:
-            transcript_before = self._load_conversation_transcript()
-            self.conversation_log.record_user_message(user_message)
-
-            system_prompt = build_system_prompt()
-            messages = prepare_message_with_history(
-                user_message, transcript_before, message_type="user"
-            )
-
-            logger.info("Processing user message through interaction agent")
-            summary = await self._run_interaction_loop(system_prompt, messages)
-
-            final_response = self._finalize_response(summary)
-
-            if final_response and not summary.user_messages:
-                self.conversation_log.record_reply(final_response)
-
-            return InteractionResult(
-                success=True,
-                response=final_response,
-                execution_agents_used=len(summary.execution_agents),
-            )
-
-        except Exception as exc:
-            logger.error("Interaction agent failed", extra={"error": str(exc)})
-            return InteractionResult(
-                success=False,
-                response="",
-                error=str(exc),
-            )
+        return await self._process_turn(
+            user_message,
+            message_type="user",
+            record=self.conversation_log.record_user_message,
+            start_log="Processing user message through interaction agent",
+            failure_log="Interaction agent failed",
+        )
 
     # Handle incoming messages from execution agents and generate appropriate responses
     async def handle_agent_message(self, agent_message: str) -> InteractionResult:
         """Process a status update emitted by an execution agent."""
 
+        return await self._process_turn(
+            agent_message,
+            message_type="agent",
+            record=self.conversation_log.record_agent_message,
+            start_log="Processing execution agent results",
+            failure_log="Interaction agent (agent message) failed",
+        )
+
+    # Shared turn flow: record the message, run the loop, and convert failures to results
+    async def _process_turn(
+        self,
+        message: str,
+        *,
+        message_type: str,
+        record: Callable[[str], None],
+        start_log: str,
+        failure_log: str,
+    ) -> InteractionResult:
+        """Run one interaction turn for a user or agent message."""
+
         try:
             transcript_before = self._load_conversation_transcript()
-            self.conversation_log.record_agent_message(agent_message)
+            record(message)
 
             system_prompt = build_system_prompt()
             messages = prepare_message_with_history(
-                agent_message, transcript_before, message_type="agent"
+                message, transcript_before, message_type=message_type
             )
 
-            logger.info("Processing execution agent results")
+            logger.info(start_log)
             summary = await self._run_interaction_loop(system_prompt, messages)
 
             final_response = self._finalize_response(summary)
@@ -124,7 +125,7 @@ class InteractionAgentRuntime:
             )
 
         except Exception as exc:
-            logger.error("Interaction agent (agent message) failed", extra={"error": str(exc)})
+            logger.error(failure_log, extra={"error": str(exc)})
             return InteractionResult(
                 success=False,
                 response="",
@@ -215,7 +216,8 @@ class InteractionAgentRuntime:
             messages=messages,
             system=system_prompt,
             api_key=self.api_key,
-            tools=self.tool_schemas,
+            tools_json=self.tool_schemas_json,
+            cache_system=True,
         )
 
     # Extract the assistant's message from the OpenRouter API response structure
@@ -232,6 +234,11 @@ class InteractionAgentRuntime:
     def _parse_tool_calls(self, raw_tool_calls: List[Dict[str, Any]]) -> List[_ToolCall]:
         """Normalize tool call payloads from the LLM."""
 
+        try:
+            return self._parse_canonical_tool_calls(raw_tool_calls)
+        except (KeyError, TypeError, orjson.JSONDecodeError):
+            pass
+
         parsed: List[_ToolCall] = []
         for raw in raw_tool_calls:
             function_block = raw.get("function") or {}
@@ -258,6 +265,20 @@ class InteractionAgentRuntime:
 
         return parsed
 
+    # Fast path for the standard {"function": {"name", "arguments": "<json object>"}} shape
+    def _parse_canonical_tool_calls(self, raw_tool_calls: List[Dict[str, Any]]) -> List[_ToolCall]:
+        """Parse well-formed tool calls, raising on anything the generic path must handle."""
+
+        parsed: List[_ToolCall] = []
+        for raw in raw_tool_calls:
+            function_block = raw["function"]
+            name = function_block["name"]
+            arguments = orjson.loads(function_block["arguments"])
+            if not isinstance(name, str) or not name or not isinstance(arguments, dict):
+                raise TypeError("non-canonical tool call")
+            parsed.append(_ToolCall(identifier=raw.get("id"), name=name, arguments=arguments))
+        return parsed
+
     # Parse and validate tool arguments from various formats (dict, JSON string, etc.)
     def _parse_tool_arguments(
         self, raw_arguments: Any
@@ -274,8 +295,8 @@ class InteractionAgentRuntime:
             if not raw_arguments.strip():
                 return {}, None
             try:
-                parsed = json.loads(raw_arguments)
-            except json.JSONDecodeError as exc:
+                parsed = orjson.loads(raw_arguments)
+            except orjson.JSONDecodeError as exc:
                 return {}, f"invalid json: {exc}"
             if isinstance(parsed, dict):
                 return parsed, None
@@ -331,30 +352,25 @@ class InteractionAgentRuntime:
     def _format_tool_result(self, tool_call: _ToolCall, result: ToolResult) -> str:
         """Render a tool execution result back to the LLM."""
 
+        arguments = tool_call.arguments
+        if "__invalid_arguments__" in arguments:
+            arguments = {
+                key: value
+                for key, value in arguments.items()
+                if key != "__invalid_arguments__"
+            }
+
         payload: Dict[str, Any] = {
             "tool": tool_call.name,
             "status": "success" if result.success else "error",
-            "arguments": {
-                key: value
-                for key, value in tool_call.arguments.items()
-                if key != "__invalid_arguments__"
-            },
+            "arguments": arguments,
         }
 
         if result.payload is not None:
             key = "result" if result.success else "error"
             payload[key] = result.payload
 
-        return self._safe_json_dump(payload)
-
-    # Safely serialize objects to JSON with fallback to string representation
-    def _safe_json_dump(self, payload: Any) -> str:
-        """Serialize payload to JSON, falling back to repr on failure."""
-
-        try:
-            return json.dumps(payload, default=str)
-        except TypeError:
-            return repr(payload)
+        return safe_json_dump(payload)
 
     # Log tool execution stages (start, done, error) with structured metadata
     def _log_tool_invocation(
@@ -367,16 +383,27 @@ class InteractionAgentRuntime:
     ) -> None:
         """Emit structured logs for tool lifecycle events."""
 
-        cleaned_args = {
-            key: value
-            for key, value in tool_call.arguments.items()
-            if key != "__invalid_arguments__"
-        }
+        if stage == "done":
+            level = logging.INFO
+        elif stage in {"error", "rejected"}:
+            level = logging.WARNING
+        else:
+            level = logging.DEBUG
+        if not logger.isEnabledFor(level):
+            return
+
+        arguments = tool_call.arguments
+        if "__invalid_arguments__" in arguments:
+            arguments = {
+                key: value
+                for key, value in arguments.items()
+                if key != "__invalid_arguments__"
+            }
 
         log_payload: Dict[str, Any] = {
             "tool": tool_call.name,
             "stage": stage,
-            "arguments": cleaned_args,
+            "arguments": arguments,
         }
 
         if result is not None:
@@ -387,12 +414,8 @@ class InteractionAgentRuntime:
         if detail:
             log_payload.update(detail)
 
-        if stage == "done":
-            logger.info(f"Tool '{tool_call.name}' completed")
-        elif stage in {"error", "rejected"}:
-            logger.warning(f"Tool '{tool_call.name}' {stage}")
-        else:
-            logger.debug(f"Tool '{tool_call.name}' {stage}")
+        message = "completed" if stage == "done" else stage
+        logger.log(level, "Tool '%s' %s", tool_call.name, message, extra=log_payload)
 
     # Determine final user-facing response from interaction loop summary
     def _finalize_response(self, summary: _LoopSummary) -> str:
@@ -402,3 +425,15 @@ class InteractionAgentRuntime:
             return summary.user_messages[-1]
 
         return summary.last_assistant_text
+
+
+_interaction_agent_runtime: Optional[InteractionAgentRuntime] = None
+
+
+# Return the shared runtime; it holds no per-turn state, so one instance serves every turn
+def get_interaction_agent_runtime() -> InteractionAgentRuntime:
+    """Return the process-wide interaction agent runtime, creating it on first use."""
+    global _interaction_agent_runtime
+    if _interaction_agent_runtime is None:
+        _interaction_agent_runtime = InteractionAgentRuntime()
+    return _interaction_agent_runtime
@@ -1,9 +1,11 @@
 """Tool definitions for interaction agent."""
 
 import asyncio
-import json
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
+
+import fastjsonschema
+import orjson
 
 from ...logging_config import logger
 from ...services.conversation import get_conversation_log
@@ -11,7 +13,7 @@ from ...services.execution import get_agent_roster, get_execution_agent_logs
 from ..execution_agent.batch_manager import ExecutionBatchManager
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolResult:
     """Standardized payload returned by interaction-agent tools."""
 
@@ -105,6 +107,15 @@ TOOL_SCHEMAS = [
     },
 ]
 
+# Schemas are static, so encode them once for request bodies
+_TOOL_SCHEMAS_JSON = orjson.dumps(TOOL_SCHEMAS)
+
+# Argument validators compiled once per tool from the declared parameter schemas
+_ARGUMENT_VALIDATORS: Dict[str, Callable[[Any], Any]] = {
+    schema["function"]["name"]: fastjsonschema.compile(schema["function"]["parameters"])
+    for schema in TOOL_SCHEMAS
+}
+
 _EXECUTION_BATCH_MANAGER = ExecutionBatchManager()
 
 
@@ -112,7 +123,7 @@ _EXECUTION_BATCH_MANAGER = ExecutionBatchManager()
 def send_message_to_agent(agent_name: str, instructions: str) -> ToolResult:
     """Send instructions to an execution agent."""
     roster = get_agent_roster()
-    roster.load()
+    roster.ensure_loaded()
     existing_agents = set(roster.get_agents())
     is_new = agent_name not in existing_agents
 
@@ -122,15 +133,15 @@ def send_message_to_agent(agent_name: str, instructions: str) -> ToolResult:
     get_execution_agent_logs().record_request(agent_name, instructions)
 
     action = "Created" if is_new else "Reused"
-    logger.info(f"{action} agent: {agent_name}")
+    logger.info("%s agent: %s", action, agent_name)
 
     async def _execute_async() -> None:
         try:
             result = await _EXECUTION_BATCH_MANAGER.execute_agent(agent_name, instructions)
             status = "SUCCESS" if result.success else "FAILED"
-            logger.info(f"Agent '{agent_name}' completed: {status}")
+            logger.info("Agent '%s' completed: %s", agent_name, status)
         except Exception as exc:  # pragma: no cover - defensive
-            logger.error(f"Agent '{agent_name}' failed: {str(exc)}")
+            logger.error("Agent '%s' failed: %s", agent_name, exc)
 
     try:
         loop = asyncio.get_running_loop()
@@ -176,7 +187,7 @@ def send_draft(
     message = f"To: {to}\nSubject: {subject}\n\n{body}"
 
     log.record_reply(message)
-    logger.info(f"Draft recorded for: {to}")
+    logger.info("Draft recorded for: %s", to)
 
     return ToolResult(
         success=True,
@@ -214,30 +225,45 @@ def get_tool_schemas():
     return TOOL_SCHEMAS
 
 
+# Return the tool schemas pre-serialized for request bodies
+def get_tool_schemas_json() -> bytes:
+    """Return the tool schemas as a pre-encoded JSON array."""
+    return _TOOL_SCHEMAS_JSON
+
+
+# Map tool names to their handlers for single-lookup dispatch
+_TOOL_HANDLERS: Dict[str, Callable[..., ToolResult]] = {
+    "send_message_to_agent": send_message_to_agent,
+    "send_message_to_user": send_message_to_user,
+    "send_draft": send_draft,
+    "wait": wait,
+}
+
+
 # Route tool calls to appropriate handlers with argument validation and error handling
 def handle_tool_call(name: str, arguments: Any) -> ToolResult:
     """Handle tool calls from interaction agent."""
     try:
         if isinstance(arguments, str):
-            args = json.loads(arguments) if arguments.strip() else {}
+            args = orjson.loads(arguments) if arguments.strip() else {}
         elif isinstance(arguments, dict):
             args = arguments
         else:
             return ToolResult(success=False, payload={"error": "Invalid arguments format"})
 
-        if name == "send_message_to_agent":
-            return send_message_to_agent(**args)
-        if name == "send_message_to_user":
-            return send_message_to_user(**args)
-        if name == "send_draft":
-            return send_draft(**args)
-        if name == "wait":
-            return wait(**args)
-
-        logger.warning("unexpected tool", extra={"tool": name})
-        return ToolResult(success=False, payload={"error": f"Unknown tool: {name}"})
-    except json.JSONDecodeError:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            logger.warning("unexpected tool", extra={"tool": name})
+            return ToolResult(success=False, payload={"error": f"Unknown tool: {name}"})
+
+        validator = _ARGUMENT_VALIDATORS.get(name)
+        if validator is not None:
+            validator(args)
+        return handler(**args)
+    except orjson.JSONDecodeError:
         return ToolResult(success=False, payload={"error": "Invalid JSON"})
+    except fastjsonschema.JsonSchemaException as exc:
+        return ToolResult(success=False, payload={"error": f"Invalid arguments: {exc.message}"})
     except TypeError as exc:
         return ToolResult(success=False, payload={"error": f"Missing required arguments: {exc}"})
     except Exception as exc:  # pragma: no cover - defensive
@@ -1,43 +1,50 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 
 from .config import get_settings
 from .logging_config import configure_logging, logger
+from .openrouter_client import close_http_client
 from .routes import api_router
-from .services import get_important_email_watcher, get_trigger_scheduler
+from .services import get_important_email_watcher, get_trigger_scheduler, warm_composio_client
+from .utils import OrjsonResponse
 
 
 # Register global exception handlers for consistent error responses across the API
 def register_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(RequestValidationError)
     async def _validation_exception_handler(request: Request, exc: RequestValidationError):
-        logger.debug("validation error", extra={"errors": exc.errors(), "path": str(request.url)})
-        return JSONResponse(
-            {"ok": False, "error": "Invalid request", "detail": exc.errors()},
+        errors = exc.errors()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("validation error", extra={"errors": errors, "path": request.url.path})
+        return OrjsonResponse(
+            {"ok": False, "error": "Invalid request", "detail": errors},
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
     @app.exception_handler(HTTPException)
     async def _http_exception_handler(request: Request, exc: HTTPException):
-        logger.debug(
-            "http error",
-            extra={"detail": exc.detail, "status": exc.status_code, "path": str(request.url)},
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "http error",
+                extra={"detail": exc.detail, "status": exc.status_code, "path": request.url.path},
+            )
         detail = exc.detail
         if not isinstance(detail, str):
-            detail = json.dumps(detail)
-        return JSONResponse({"ok": False, "error": detail}, status_code=exc.status_code)
+            # Keep json.dumps spacing so the encoded detail string matches earlier releases
+            detail = json.dumps(detail, default=str)
+        return OrjsonResponse({"ok": False, "error": detail}, status_code=exc.status_code)
 
     @app.exception_handler(Exception)
     async def _unhandled_exception_handler(request: Request, exc: Exception):
-        logger.exception("Unhandled error", extra={"path": str(request.url)})
-        return JSONResponse(
+        logger.exception("Unhandled error", extra={"path": request.url.path})
+        return OrjsonResponse(
             {"ok": False, "error": "Internal server error"},
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         )
@@ -59,6 +66,7 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers reuse preflight results for a day
 )
 
 register_exception_handlers(app)
@@ -66,21 +74,28 @@ app.include_router(api_router)
 
 
 @app.on_event("startup")
-# Initialize background services (trigger scheduler and email watcher) when the app starts
+# Initialize background services (trigger scheduler, email watcher, Composio client) when the app starts
 async def _start_trigger_scheduler() -> None:
     scheduler = get_trigger_scheduler()
-    await scheduler.start()
     watcher = get_important_email_watcher()
-    await watcher.start()
+    await asyncio.gather(
+        scheduler.start(),
+        watcher.start(),
+        asyncio.to_thread(warm_composio_client),
+    )
 
 
 @app.on_event("shutdown")
 # Gracefully shutdown background services when the app stops
 async def _stop_trigger_scheduler() -> None:
     scheduler = get_trigger_scheduler()
-    await scheduler.stop()
     watcher = get_important_email_watcher()
-    await watcher.stop()
+    # Each stop waits for its in-flight poll to unwind, so let them overlap
+    results = await asyncio.gather(scheduler.stop(), watcher.stop(), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("background service shutdown failed", extra={"error": str(result)})
+    await close_http_client()
 
 
 __all__ = ["app"]
@@ -1,9 +1,9 @@
 """Simplified configuration management."""
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from pydantic import BaseModel, Field
 
@@ -30,70 +30,90 @@ _load_env_file()
 
 DEFAULT_APP_NAME = "OpenPoke Server"
 DEFAULT_APP_VERSION = "0.3.0"
+DEFAULT_MODEL = "anthropic/claude-sonnet-4"
 
 
-def _env_int(name: str, fallback: int) -> int:
+def _env_int(env: Mapping[str, str], name: str, fallback: int) -> int:
     try:
-        return int(os.getenv(name, str(fallback)))
+        return int(env.get(name, str(fallback)))
     except (TypeError, ValueError):
         return fallback
 
 
 class Settings(BaseModel):
-    """Application settings with lightweight env fallbacks."""
+    """Application settings; environment values are supplied by ``get_settings``."""
 
     # App metadata
     app_name: str = Field(default=DEFAULT_APP_NAME)
     app_version: str = Field(default=DEFAULT_APP_VERSION)
 
     # Server runtime
-    server_host: str = Field(default=os.getenv("OPENPOKE_HOST", "0.0.0.0"))
-    server_port: int = Field(default=_env_int("OPENPOKE_PORT", 8001))
+    server_host: str = Field(default="0.0.0.0")
+    server_port: int = Field(default=8001)
 
     # LLM model selection - single variable for all agents
     # Set ALYN_MODEL in Railway to change the model for all agents
     # Example: ALYN_MODEL=openai/gpt-4-turbo
-    _default_model: str = os.getenv("ALYN_MODEL", "anthropic/claude-sonnet-4")
-
-    interaction_agent_model: str = Field(default_factory=lambda: os.getenv("ALYN_MODEL", "anthropic/claude-sonnet-4"))
-    execution_agent_model: str = Field(default_factory=lambda: os.getenv("ALYN_MODEL", "anthropic/claude-sonnet-4"))
-    execution_agent_search_model: str = Field(default_factory=lambda: os.getenv("ALYN_MODEL", "anthropic/claude-sonnet-4"))
-    summarizer_model: str = Field(default_factory=lambda: os.getenv("ALYN_MODEL", "anthropic/claude-sonnet-4"))
-    email_classifier_model: str = Field(default_factory=lambda: os.getenv("ALYN_MODEL", "anthropic/claude-sonnet-4"))
+    interaction_agent_model: str = Field(default=DEFAULT_MODEL)
+    execution_agent_model: str = Field(default=DEFAULT_MODEL)
+    execution_agent_search_model: str = Field(default=DEFAULT_MODEL)
+    summarizer_model: str = Field(default=DEFAULT_MODEL)
+    email_classifier_model: str = Field(default=DEFAULT_MODEL)
 
     # Credentials / integrations
-    openrouter_api_key: Optional[str] = Field(default=os.getenv("OPENROUTER_API_KEY"))
-    composio_gmail_auth_config_id: Optional[str] = Field(default=os.getenv("COMPOSIO_GMAIL_AUTH_CONFIG_ID"))
-    composio_api_key: Optional[str] = Field(default=os.getenv("COMPOSIO_API_KEY"))
+    openrouter_api_key: Optional[str] = Field(default=None)
+    composio_gmail_auth_config_id: Optional[str] = Field(default=None)
+    composio_api_key: Optional[str] = Field(default=None)
 
     # HTTP behaviour
-    cors_allow_origins_raw: str = Field(default=os.getenv("OPENPOKE_CORS_ALLOW_ORIGINS", "*"))
-    enable_docs: bool = Field(default=os.getenv("OPENPOKE_ENABLE_DOCS", "1") != "0")
-    docs_url: Optional[str] = Field(default=os.getenv("OPENPOKE_DOCS_URL", "/docs"))
+    cors_allow_origins_raw: str = Field(default="*")
+    enable_docs: bool = Field(default=True)
+    docs_url: Optional[str] = Field(default="/docs")
 
     # Summarisation controls
     conversation_summary_threshold: int = Field(default=100)
     conversation_summary_tail_size: int = Field(default=10)
 
-    @property
+    # Derived values are computed on first access and reused; settings are cached for the process
+    @cached_property
     def cors_allow_origins(self) -> List[str]:
         """Parse CORS origins from comma-separated string."""
         if self.cors_allow_origins_raw.strip() in {"", "*"}:
             return ["*"]
         return [origin.strip() for origin in self.cors_allow_origins_raw.split(",") if origin.strip()]
 
-    @property
+    @cached_property
     def resolved_docs_url(self) -> Optional[str]:
         """Return documentation URL when docs are enabled."""
         return (self.docs_url or "/docs") if self.enable_docs else None
 
-    @property
+    @cached_property
     def summarization_enabled(self) -> bool:
         """Flag indicating conversation summarisation is active."""
         return self.conversation_summary_threshold > 0
 
 
+# Read every environment-backed setting from a single snapshot of os.environ
+def _settings_from_env(env: Mapping[str, str]) -> Dict[str, Any]:
+    model = env.get("ALYN_MODEL", DEFAULT_MODEL)
+    return {
+        "server_host": env.get("OPENPOKE_HOST", "0.0.0.0"),
+        "server_port": _env_int(env, "OPENPOKE_PORT", 8001),
+        "interaction_agent_model": model,
+        "execution_agent_model": model,
+        "execution_agent_search_model": model,
+        "summarizer_model": model,
+        "email_classifier_model": model,
+        "openrouter_api_key": env.get("OPENROUTER_API_KEY"),
+        "composio_gmail_auth_config_id": env.get("COMPOSIO_GMAIL_AUTH_CONFIG_ID"),
+        "composio_api_key": env.get("COMPOSIO_API_KEY"),
+        "cors_allow_origins_raw": env.get("OPENPOKE_CORS_ALLOW_ORIGINS", "*"),
+        "enable_docs": env.get("OPENPOKE_ENABLE_DOCS", "1") != "0",
+        "docs_url": env.get("OPENPOKE_DOCS_URL", "/docs"),
+    }
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
-    return Settings()
+    return Settings(**_settings_from_env(dict(os.environ)))
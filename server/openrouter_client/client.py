@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import weakref
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 
 from ..config import get_settings
 
 OpenRouterBaseURL = "https://openrouter.ai/api/v1"
 
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=75.0)
+# One client per event loop; entries disappear with their loop
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class OpenRouterError(RuntimeError):
     """Raised when the OpenRouter API returns an error response."""
@@ -29,10 +38,50 @@ def _headers(*, api_key: Optional[str] = None) -> Dict[str, str]:
     return headers
 
 
-def _build_messages(messages: List[Dict[str, str]], system: Optional[str]) -> List[Dict[str, str]]:
-    if system:
-        return [{"role": "system", "content": system}, *messages]
-    return messages
+# Providers that honour explicit cache_control breakpoints through OpenRouter
+_CACHE_CONTROL_MODEL_PREFIXES = ("anthropic/", "google/gemini")
+
+
+def _build_messages(
+    messages: List[Dict[str, str]],
+    system: Optional[str],
+    *,
+    model: str = "",
+    cache_system: bool = False,
+) -> List[Dict[str, Any]]:
+    if not system:
+        return messages
+    if cache_system and model.startswith(_CACHE_CONTROL_MODEL_PREFIXES):
+        # Mark the static system prompt as a cacheable prefix for the provider
+        content: Any = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+        return [{"role": "system", "content": content}, *messages]
+    return [{"role": "system", "content": system}, *messages]
+
+
+def _encode_payload(payload: Dict[str, object], tools_json: Optional[bytes]) -> bytes:
+    body = orjson.dumps(payload)
+    if tools_json is None:
+        return body
+    # Splice the pre-serialized tool array into the encoded request object
+    return body[:-1] + b',"tools":' + tools_json + b"}"
+
+
+# Reuse one pooled client per event loop so TLS connections survive across calls
+def _get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's HTTP client; a new one is created on next use."""
+
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
 
 
 def _handle_response_error(exc: httpx.HTTPStatusError) -> None:
@@ -53,39 +102,47 @@ async def request_chat_completion(
     system: Optional[str] = None,
     api_key: Optional[str] = None,
     tools: Optional[List[Dict[str, Any]]] = None,
+    tools_json: Optional[bytes] = None,
+    cache_system: bool = False,
     base_url: str = OpenRouterBaseURL,
 ) -> Dict[str, Any]:
-    """Request a chat completion and return the raw JSON payload."""
+    """Request a chat completion and return the raw JSON payload.
+
+    ``tools_json`` may carry an already-encoded JSON array of tool schemas; it
+    takes precedence over ``tools`` and avoids re-encoding static schemas.
+    ``cache_system`` marks the system prompt as a cacheable prefix on providers
+    that support prompt caching.
+    """
 
     payload: Dict[str, object] = {
         "model": model,
-        "messages": _build_messages(messages, system),
+        "messages": _build_messages(messages, system, model=model, cache_system=cache_system),
         "stream": False,
     }
-    if tools:
+    if tools and tools_json is None:
         payload["tools"] = tools
 
     url = f"{base_url.rstrip('/')}/chat/completions"
 
-    async with httpx.AsyncClient() as client:
+    client = _get_http_client()
+    try:
+        response = await client.post(
+            url,
+            headers=_headers(api_key=api_key),
+            content=_encode_payload(payload, tools_json),
+            timeout=60.0,  # Set reasonable timeout instead of None
+        )
         try:
-            response = await client.post(
-                url,
-                headers=_headers(api_key=api_key),
-                json=payload,
-                timeout=60.0,  # Set reasonable timeout instead of None
-            )
-            try:
-                response.raise_for_status()
-            except httpx.HTTPStatusError as exc:
-                _handle_response_error(exc)
-            return response.json()
-        except httpx.HTTPStatusError as exc:  # pragma: no cover - handled above
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
             _handle_response_error(exc)
-        except httpx.HTTPError as exc:
-            raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
+        return response.json()
+    except httpx.HTTPStatusError as exc:  # pragma: no cover - handled above
+        _handle_response_error(exc)
+    except httpx.HTTPError as exc:
+        raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
 
     raise OpenRouterError("OpenRouter request failed: unknown error")
 
 
-__all__ = ["OpenRouterError", "request_chat_completion", "OpenRouterBaseURL"]
+__all__ = ["OpenRouterError", "close_http_client", "request_chat_completion", "OpenRouterBaseURL"]
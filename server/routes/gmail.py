@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from ..config import Settings, get_settings
+from ..config import get_settings
 from ..models import GmailConnectPayload, GmailDisconnectPayload, GmailStatusPayload
 from ..services import disconnect_account, fetch_status, initiate_connect
 
@@ -12,8 +12,8 @@ router = APIRouter(prefix="/gmail", tags=["gmail"])
 
 @router.post("/connect")
 # Initiate Gmail OAuth connection flow through Composio
-async def gmail_connect(payload: GmailConnectPayload, settings: Settings = Depends(get_settings)) -> JSONResponse:
-    return initiate_connect(payload, settings)
+async def gmail_connect(payload: GmailConnectPayload) -> JSONResponse:
+    return initiate_connect(payload, get_settings())
 
 
 @router.post("/status")
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, status
 
-from ..config import Settings, get_settings
+from ..config import get_settings
 from ..models import (
     HealthResponse,
     RootResponse,
@@ -15,13 +15,13 @@ router = APIRouter(tags=["meta"])
 
 @router.get("/health", response_model=HealthResponse)
 # Return service health status for monitoring and load balancers
-def health(settings: Settings = Depends(get_settings)) -> HealthResponse:
-    return HealthResponse(ok=True, service="openpoke", version=settings.app_version)
+def health() -> HealthResponse:
+    return HealthResponse(ok=True, service="openpoke", version=get_settings().app_version)
 
 
 @router.get("/meta", response_model=RootResponse)
 # Return service metadata including available API endpoints
-def meta(request: Request, settings: Settings = Depends(get_settings)) -> RootResponse:
+def meta(request: Request) -> RootResponse:
     endpoints = sorted(
         {
             route.path
@@ -32,7 +32,7 @@ def meta(request: Request, settings: Settings = Depends(get_settings)) -> RootRe
     return RootResponse(
         status="ok",
         service="openpoke",
-        version=settings.app_version,
+        version=get_settings().app_version,
         endpoints=endpoints,
     )
 
@@ -4,6 +4,7 @@ from fastapi import APIRouter
 from pydantic import BaseModel
 
 from ..services.user_profile import get_user_profile
+from ..utils import OrjsonResponse
 
 router = APIRouter(prefix="/profile", tags=["profile"])
 
@@ -15,20 +16,15 @@ class UserProfileData(BaseModel):
     location: str = ""
 
 
-@router.post("/save")
+@router.post("/save", response_class=OrjsonResponse)
 def save_profile(profile: UserProfileData):
     """Save user profile."""
     profile_store = get_user_profile()
-    profile_dict = {
-        "userName": profile.userName,
-        "birthDate": profile.birthDate,
-        "location": profile.location,
-    }
-    profile_store.save(profile_dict)
+    profile_store.save(profile.model_dump())
     return {"ok": True}
 
 
-@router.get("/load")
+@router.get("/load", response_class=OrjsonResponse)
 def load_profile():
     """Load user profile."""
     profile_store = get_user_profile()
@@ -19,6 +19,7 @@ from .gmail import (
     get_active_gmail_user_id,
     get_important_email_watcher,
     initiate_connect,
+    warm_composio_client,
 )
 from .trigger_scheduler import get_trigger_scheduler
 from .triggers import get_trigger_service
@@ -45,6 +46,7 @@ __all__ = [
     "get_active_gmail_user_id",
     "get_important_email_watcher",
     "initiate_connect",
+    "warm_composio_client",
     "get_trigger_scheduler",
     "get_trigger_service",
     "TimezoneStore",
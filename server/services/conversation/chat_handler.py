@@ -4,7 +4,7 @@ from typing import Optional, Union
 from fastapi import status
 from fastapi.responses import JSONResponse, PlainTextResponse
 
-from ...agents.interaction_agent.runtime import InteractionAgentRuntime
+from ...agents.interaction_agent.runtime import get_interaction_agent_runtime
 from ...logging_config import logger
 from ...models import ChatMessage, ChatRequest
 from ...utils import error_response
@@ -32,7 +32,7 @@ async def handle_chat_request(payload: ChatRequest) -> Union[PlainTextResponse,
     logger.info("chat request", extra={"message_length": len(user_content)})
 
     try:
-        runtime = InteractionAgentRuntime()
+        runtime = get_interaction_agent_runtime()
     except ValueError as ve:
         # Missing API key error
         logger.error("configuration error", extra={"error": str(ve)})
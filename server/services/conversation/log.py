@@ -4,7 +4,7 @@ import re
 import threading
 from html import escape, unescape
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Protocol, Tuple
+from typing import Dict, Iterator, List, Optional, Protocol, TextIO, Tuple
 
 from ...config import get_settings
 from ...logging_config import logger
@@ -56,6 +56,8 @@ class ConversationLog:
         self._path = path
         self._formatter = formatter
         self._lock = threading.Lock()
+        # Append handle kept open across writes; reopened lazily after clear or failure
+        self._handle: Optional[TextIO] = None
         self._ensure_directory()
         self._working_memory_log = _resolve_working_memory_log()
 
@@ -70,9 +72,12 @@ class ConversationLog:
         entry = self._formatter(tag, timestamp, str(payload))
         with self._lock:
             try:
-                with self._path.open("a", encoding="utf-8") as handle:
-                    handle.write(entry)
+                if self._handle is None:
+                    self._handle = self._path.open("a", encoding="utf-8")
+                self._handle.write(entry)
+                self._handle.flush()
             except Exception as exc:  # pragma: no cover - defensive
+                self._close_handle_locked()
                 logger.error(
                     "conversation log append failed",
                     extra={"error": str(exc), "tag": tag, "path": str(self._path)},
@@ -81,6 +86,14 @@ class ConversationLog:
         self._notify_summarization()
         return timestamp
 
+    def _close_handle_locked(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:  # pragma: no cover - defensive cleanup
+                pass
+
     def _parse_line(self, line: str) -> Optional[Tuple[str, str, str]]:
         stripped = line.strip()
         if not stripped.startswith("<") or "</" not in stripped:
@@ -101,10 +114,12 @@ class ConversationLog:
         if closing_tag != tag:
             return None
         payload = stripped[open_end + 1 : close_start]
-        attributes: Dict[str, str] = {
-            match.group(1): match.group(2) for match in _ATTR_PATTERN.finditer(attr_string)
-        }
-        timestamp = attributes.get("timestamp", "")
+        timestamp = ""
+        if attr_string:
+            attributes: Dict[str, str] = {
+                match.group(1): match.group(2) for match in _ATTR_PATTERN.finditer(attr_string)
+            }
+            timestamp = attributes.get("timestamp", "")
         return tag, timestamp, _decode_payload(payload)
 
     def iter_entries(self) -> Iterator[Tuple[str, str, str]]:
@@ -193,6 +208,7 @@ class ConversationLog:
 
     def clear(self) -> None:
         with self._lock:
+            self._close_handle_locked()
             try:
                 if self._path.exists():
                     self._path.unlink()
@@ -21,10 +21,10 @@ def _resolve_conversation_log() -> "ConversationLog":
 
 
 def _collect_entries(log) -> List[LogEntry]:
-    entries: List[LogEntry] = []
-    for index, (tag, timestamp, payload) in enumerate(log.iter_entries()):
-        entries.append(LogEntry(tag=tag, payload=payload, index=index, timestamp=timestamp or None))
-    return entries
+    return [
+        LogEntry(tag=tag, payload=payload, index=index, timestamp=timestamp or None)
+        for index, (tag, timestamp, payload) in enumerate(log.iter_entries())
+    ]
 
 
 async def _call_openrouter(prompt: SummaryPrompt, model: str, api_key: Optional[str]) -> str:
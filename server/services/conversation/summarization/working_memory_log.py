@@ -34,16 +34,29 @@ def _format_line(tag: str, payload: str, timestamp: Optional[str] = None) -> str
     return f"<{tag}>{encoded}</{tag}>\n"
 
 
+_TIMESTAMP_PATTERN = re.compile(r'timestamp="([^"]*)"')
+
+
 def _current_timestamp() -> str:
     return now_in_user_timezone("%Y-%m-%d %H:%M:%S")
 
 
+def _render_entry(tag: str, payload: str, timestamp: Optional[str]) -> str:
+    safe_payload = escape(payload, quote=False)
+    if timestamp:
+        return f'<{tag} timestamp="{timestamp}">{safe_payload}</{tag}>'
+    return f'<{tag}>{safe_payload}</{tag}>'
+
+
 class WorkingMemoryLog:
     """Persisted working-memory file storing conversation summary and recent entries."""
 
     def __init__(self, path: Path) -> None:
         self._path = path
         self._lock = threading.Lock()
+        # Rendered transcript of the on-disk state; bumped version drops stale renders
+        self._version = 0
+        self._transcript_cache: Optional[str] = None
         self._ensure_directory()
         self._initialize_file()
 
@@ -88,16 +101,28 @@ class WorkingMemoryLog:
                 with self._path.open("a", encoding="utf-8") as handle:
                     handle.write(line)
             except Exception as exc:  # pragma: no cover - defensive
+                self._invalidate_transcript_locked()
                 logger.error(
                     "working memory append failed",
                     extra={"error": str(exc), "tag": tag, "path": str(self._path)},
                 )
                 raise
+            self._version += 1
+            if self._transcript_cache is not None:
+                # Entries are append-only, so extend the cached render instead of rebuilding it
+                rendered = _render_entry(
+                    tag, _decode_payload(_encode_payload(str(payload))), sanitized_timestamp
+                )
+                if self._transcript_cache:
+                    self._transcript_cache = f"{self._transcript_cache}\n{rendered}"
+                else:
+                    self._transcript_cache = rendered
 
     def load_summary_state(self) -> SummaryState:
         with self._lock:
             try:
-                lines = self._path.read_text(encoding="utf-8").splitlines()
+                # Split on "\n" only: payloads may legitimately contain \x0c or \u2028
+                lines = self._path.read_text(encoding="utf-8").split("\n")
             except FileNotFoundError:
                 return SummaryState.empty()
             except Exception as exc:  # pragma: no cover - defensive
@@ -162,6 +187,7 @@ class WorkingMemoryLog:
         temp_path = self._path.with_suffix(".tmp")
         data = "".join(lines)
         with self._lock:
+            self._invalidate_transcript_locked()
             try:
                 temp_path.write_text(data, encoding="utf-8")
                 temp_path.replace(self._path)
@@ -179,7 +205,22 @@ class WorkingMemoryLog:
                         pass
 
     def render_transcript(self, state: Optional[SummaryState] = None) -> str:
-        snapshot = state or self.load_summary_state()
+        if state is not None:
+            return self._render_state(state)
+
+        with self._lock:
+            cached = self._transcript_cache
+            version = self._version
+        if cached is not None:
+            return cached
+
+        rendered = self._render_state(self.load_summary_state())
+        with self._lock:
+            if self._version == version:
+                self._transcript_cache = rendered
+        return rendered
+
+    def _render_state(self, snapshot: SummaryState) -> str:
         parts: List[str] = []
 
         summary_text = (snapshot.summary_text or "").strip()
@@ -188,18 +229,17 @@ class WorkingMemoryLog:
             parts.append(f"<conversation_summary>{safe_summary}</conversation_summary>")
 
         for entry in snapshot.unsummarized_entries:
-            safe_payload = escape(entry.payload, quote=False)
-            if entry.timestamp:
-                parts.append(
-                    f'<{entry.tag} timestamp="{entry.timestamp}">{safe_payload}</{entry.tag}>'
-                )
-            else:
-                parts.append(f'<{entry.tag}>{safe_payload}</{entry.tag}>')
+            parts.append(_render_entry(entry.tag, entry.payload, entry.timestamp))
 
         return '\n'.join(parts)
 
+    def _invalidate_transcript_locked(self) -> None:
+        self._version += 1
+        self._transcript_cache = None
+
     def clear(self) -> None:
         with self._lock:
+            self._invalidate_transcript_locked()
             try:
                 if self._path.exists():
                     self._path.unlink()
@@ -233,8 +273,8 @@ class WorkingMemoryLog:
             return None
         payload = stripped[open_end + 1 : close_start]
         timestamp = None
-        if attr_string:
-            match = re.search(r'timestamp="([^"]*)"', attr_string)
+        if "timestamp=" in attr_string:
+            match = _TIMESTAMP_PATTERN.search(attr_string)
             if match:
                 timestamp = match.group(1)
         return tag, timestamp, _decode_payload(payload)
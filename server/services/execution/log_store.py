@@ -102,10 +102,12 @@ class ExecutionAgentLogStore:
         if closing_tag != tag:
             return None
 
-        attributes: Dict[str, str] = {
-            match.group(1): match.group(2) for match in _ATTR_PATTERN.finditer(attr_string)
-        }
-        timestamp = attributes.get("timestamp", "")
+        timestamp = ""
+        if attr_string:
+            attributes: Dict[str, str] = {
+                match.group(1): match.group(2) for match in _ATTR_PATTERN.finditer(attr_string)
+            }
+            timestamp = attributes.get("timestamp", "")
         payload = _decode_payload(stripped[open_end + 1 : close_start])
         return tag, timestamp, payload
 
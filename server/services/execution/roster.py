@@ -4,6 +4,7 @@ import json
 import fcntl
 import time
 from pathlib import Path
+from typing import Optional
 
 from ...logging_config import logger
 
@@ -14,12 +15,15 @@ class AgentRoster:
     def __init__(self, roster_path: Path):
         self._roster_path = roster_path
         self._agents: list[str] = []
+        # mtime of roster.json as of the last load/save, used to skip unchanged reloads
+        self._mtime_ns: Optional[int] = None
         self.load()
 
     def load(self) -> None:
         """Load agent names from roster.json."""
         if self._roster_path.exists():
             try:
+                self._mtime_ns = self._roster_path.stat().st_mtime_ns
                 with open(self._roster_path, 'r') as f:
                     data = json.load(f)
                     if isinstance(data, list):
@@ -27,10 +31,20 @@ class AgentRoster:
             except Exception as exc:
                 logger.warning(f"Failed to load roster.json: {exc}")
                 self._agents = []
+                self._mtime_ns = None
         else:
             self._agents = []
             self.save()
 
+    def ensure_loaded(self) -> None:
+        """Reload agent names only if roster.json changed since the last load or save."""
+        try:
+            mtime_ns = self._roster_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = None
+        if mtime_ns is None or mtime_ns != self._mtime_ns:
+            self.load()
+
     def save(self) -> None:
         """Save agent names to roster.json with file locking."""
         max_retries = 5
@@ -45,6 +59,8 @@ class AgentRoster:
                     fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
                     try:
                         json.dump(self._agents, f, indent=2)
+                        f.flush()
+                        self._mtime_ns = self._roster_path.stat().st_mtime_ns
                         return
                     finally:
                         fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -73,6 +89,7 @@ class AgentRoster:
     def clear(self) -> None:
         """Clear the agent roster."""
         self._agents = []
+        self._mtime_ns = None
         try:
             if self._roster_path.exists():
                 self._roster_path.unlink()
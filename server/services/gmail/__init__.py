@@ -6,6 +6,7 @@ from .client import (
     fetch_status,
     get_active_gmail_user_id,
     initiate_connect,
+    warm_composio_client,
 )
 from .importance_classifier import classify_email_importance
 from .importance_watcher import ImportantEmailWatcher, get_important_email_watcher
@@ -18,6 +19,7 @@ __all__ = [
     "initiate_connect",
     "disconnect_account",
     "get_active_gmail_user_id",
+    "warm_composio_client",
     "classify_email_importance",
     "ImportantEmailWatcher",
     "get_important_email_watcher",
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 import threading
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
+import orjson
 from fastapi import status
 from fastapi.responses import JSONResponse
 
@@ -45,6 +45,15 @@ def _gmail_import_client():
     return Composio
 
 
+# Timeouts and dropped connections surface as APIConnectionError (APITimeoutError subclasses it)
+def _gmail_transient_errors() -> Tuple[type, ...]:
+    try:
+        from composio_client import APIConnectionError  # type: ignore
+    except ImportError:
+        return ()
+    return (APIConnectionError,)
+
+
 # Get or create a singleton Composio client instance with thread-safe initialization
 def _get_composio_client(settings: Optional[Settings] = None):
     global _CLIENT
@@ -67,6 +76,16 @@ def _get_composio_client(settings: Optional[Settings] = None):
     return _CLIENT
 
 
+# Build the Composio client ahead of the first Gmail request so it doesn't pay the SDK import
+def warm_composio_client() -> bool:
+    try:
+        _get_composio_client()
+    except Exception as exc:
+        logger.warning("Composio client warmup failed", extra={"error": str(exc)})
+        return False
+    return True
+
+
 def _extract_email(obj: Any) -> Optional[str]:
     if obj is None:
         return None
@@ -435,32 +454,53 @@ def disconnect_account(payload: GmailDisconnectPayload) -> JSONResponse:
     return JSONResponse(payload)
 
 
+def _dump_model(result: Any) -> Any:
+    return result.model_dump()
+
+
+def _dump_legacy_model(result: Any) -> Any:
+    return result.dict()
+
+
+def _dump_model_json(result: Any) -> Any:
+    return orjson.loads(result.model_dump_json())
+
+
+def _wrap_plain(result: Any) -> Dict[str, Any]:
+    if isinstance(result, dict):
+        return result
+    if isinstance(result, list):
+        return {"items": result}
+    return {"repr": str(result)}
+
+
+_NORMALIZERS: Dict[type, Tuple[Callable[[Any], Any], ...]] = {}
+
+
+# Resolve which serializers a response class supports once, then reuse them for every instance
+def _normalizers_for(result_type: type) -> Tuple[Callable[[Any], Any], ...]:
+    normalizers = _NORMALIZERS.get(result_type)
+    if normalizers is None:
+        candidates = []
+        if hasattr(result_type, "model_dump"):
+            candidates.append(_dump_model)
+        elif hasattr(result_type, "dict"):
+            candidates.append(_dump_legacy_model)
+        if hasattr(result_type, "model_dump_json"):
+            candidates.append(_dump_model_json)
+        normalizers = _NORMALIZERS.setdefault(result_type, tuple(candidates))
+    return normalizers
+
+
 def _normalize_tool_response(result: Any) -> Dict[str, Any]:
-    payload_dict: Optional[Dict[str, Any]] = None
-    try:
-        if hasattr(result, "model_dump"):
-            payload_dict = result.model_dump()  # type: ignore[assignment]
-        elif hasattr(result, "dict"):
-            payload_dict = result.dict()  # type: ignore[assignment]
-    except Exception:
-        payload_dict = None
-
-    if payload_dict is None:
+    for normalizer in _normalizers_for(type(result)):
         try:
-            if hasattr(result, "model_dump_json"):
-                payload_dict = json.loads(result.model_dump_json())
+            payload = normalizer(result)
         except Exception:
-            payload_dict = None
-
-    if payload_dict is None:
-        if isinstance(result, dict):
-            payload_dict = result
-        elif isinstance(result, list):
-            payload_dict = {"items": result}
-        else:
-            payload_dict = {"repr": str(result)}
-
-    return payload_dict
+            continue
+        if payload is not None:
+            return payload
+    return _wrap_plain(result)
 
 
 # Execute Gmail operations through Composio SDK with error handling
@@ -487,8 +527,15 @@ def execute_gmail_tool(
         )
         return _normalize_tool_response(result)
     except Exception as exc:
-        logger.exception(
-            "gmail tool execution failed",
-            extra={"tool": tool_name, "user_id": composio_user_id},
-        )
+        if isinstance(exc, _gmail_transient_errors()):
+            # Routine network failures on the watcher's poll path; skip the traceback
+            logger.warning(
+                "gmail tool execution failed",
+                extra={"tool": tool_name, "user_id": composio_user_id, "error": str(exc)},
+            )
+        else:
+            logger.exception(
+                "gmail tool execution failed",
+                extra={"tool": tool_name, "user_id": composio_user_id},
+            )
         raise RuntimeError(f"{tool_name} invocation failed: {exc}") from exc
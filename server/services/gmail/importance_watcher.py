@@ -20,9 +20,9 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
 
 
 def _resolve_interaction_runtime() -> "InteractionAgentRuntime":
-    from ...agents.interaction_agent.runtime import InteractionAgentRuntime
+    from ...agents.interaction_agent.runtime import get_interaction_agent_runtime
 
-    return InteractionAgentRuntime()
+    return get_interaction_agent_runtime()
 
 
 DEFAULT_POLL_INTERVAL_SECONDS = 60.0
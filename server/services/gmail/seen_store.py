@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import json
 import threading
-from collections import deque
+from collections import OrderedDict
 from pathlib import Path
-from typing import Deque, Iterable, List, Optional, Set
+from typing import Iterable, List, Optional
 
 from ...logging_config import logger
 
@@ -18,8 +18,8 @@ class GmailSeenStore:
         self._path = path
         self._max_entries = max_entries
         self._lock = threading.Lock()
-        self._entries: Deque[str] = deque()
-        self._index: Set[str] = set()
+        # Insertion-ordered index: O(1) membership and recency refresh
+        self._entries: "OrderedDict[str, None]" = OrderedDict()
         self._load()
 
     # ------------------------------------------------------------------
@@ -34,7 +34,7 @@ class GmailSeenStore:
         if not normalized:
             return False
         with self._lock:
-            return normalized in self._index
+            return normalized in self._entries
 
     def mark_seen(self, message_ids: Iterable[str]) -> None:
         normalized_ids = [mid for mid in (self._normalize(mid) for mid in message_ids) if mid]
@@ -43,15 +43,11 @@ class GmailSeenStore:
 
         with self._lock:
             for message_id in normalized_ids:
-                if message_id in self._index:
-                    # Refresh recency by removing and re-appending
-                    try:
-                        self._entries.remove(message_id)
-                    except ValueError:  # pragma: no cover - defensive
-                        pass
+                if message_id in self._entries:
+                    # Refresh recency by moving to the newest position
+                    self._entries.move_to_end(message_id)
                 else:
-                    self._index.add(message_id)
-                self._entries.append(message_id)
+                    self._entries[message_id] = None
 
             self._prune_locked()
             self._persist_locked()
@@ -63,7 +59,6 @@ class GmailSeenStore:
     def clear(self) -> None:
         with self._lock:
             self._entries.clear()
-            self._index.clear()
             self._persist_locked()
 
     # ------------------------------------------------------------------
@@ -95,14 +90,12 @@ class GmailSeenStore:
 
         for raw_id in data[-self._max_entries :]:
             normalized = self._normalize(raw_id)
-            if normalized and normalized not in self._index:
-                self._entries.append(normalized)
-                self._index.add(normalized)
+            if normalized and normalized not in self._entries:
+                self._entries[normalized] = None
 
     def _prune_locked(self) -> None:
         while len(self._entries) > self._max_entries:
-            oldest = self._entries.popleft()
-            self._index.discard(oldest)
+            self._entries.popitem(last=False)
 
     def _persist_locked(self) -> None:
         try:
@@ -34,8 +34,9 @@ class TimezoneStore:
         self._cached = value or None
 
     def get_timezone(self, default: str = "UTC") -> str:
-        with self._lock:
-            return self._cached or default
+        # Writers swap the cached reference under the lock; a single attribute
+        # read is atomic, so readers on the hot path skip the lock entirely.
+        return self._cached or default
 
     def set_timezone(self, timezone_name: str) -> None:
         validated = self._validate(timezone_name)
@@ -180,8 +180,10 @@ class TriggerService:
         updated = self._store.update(trigger_id, agent_name, fields)
         return self._store.fetch_one(trigger_id, agent_name) if updated else existing
 
-    def list_triggers(self, *, agent_name: str) -> List[TriggerRecord]:
-        return self._store.list_for_agent(agent_name)
+    def list_triggers(
+        self, *, agent_name: str, limit: Optional[int] = None
+    ) -> List[TriggerRecord]:
+        return self._store.list_for_agent(agent_name, limit=limit)
 
     def get_due_triggers(
         self, *, before: datetime, agent_name: Optional[str] = None
@@ -93,12 +93,14 @@ class TriggerStore:
             cursor = conn.execute(sql, payload)
             return cursor.rowcount > 0
 
-    def list_for_agent(self, agent_name: str) -> List[TriggerRecord]:
+    def list_for_agent(self, agent_name: str, limit: Optional[int] = None) -> List[TriggerRecord]:
+        sql = "SELECT * FROM triggers WHERE agent_name = ? ORDER BY next_trigger IS NULL, next_trigger"
+        params: List[Any] = [agent_name]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
         with self._lock, self._connect() as conn:
-            rows = conn.execute(
-                "SELECT * FROM triggers WHERE agent_name = ? ORDER BY next_trigger IS NULL, next_trigger",
-                (agent_name,),
-            ).fetchall()
+            rows = conn.execute(sql, params).fetchall()
         return [self._row_to_record(row) for row in rows]
 
     def fetch_due(
@@ -17,6 +17,8 @@ class UserProfile:
     def __init__(self, path: Path):
         self._path = path
         self._lock = threading.Lock()
+        self._version = 0
+        self._cached: Optional[Dict[str, str]] = None
         self._ensure_directory()
 
     def _ensure_directory(self) -> None:
@@ -31,21 +33,35 @@ class UserProfile:
             try:
                 with self._path.open("w", encoding="utf-8") as handle:
                     json.dump(profile, handle, indent=2)
+                self._cached = dict(profile)
+                self._version += 1
             except Exception as exc:
+                self._cached = None
                 logger.error(
                     "user profile save failed",
                     extra={"error": str(exc), "path": str(self._path)},
                 )
                 raise
 
+    @property
+    def version(self) -> int:
+        """Counter bumped on every write, used to invalidate derived caches."""
+        return self._version
+
     def load(self) -> Dict[str, str]:
-        """Load user profile from disk."""
+        """Load user profile from disk, serving repeat reads from memory until the next write."""
         with self._lock:
+            if self._cached is not None:
+                return dict(self._cached)
             try:
                 if not self._path.exists():
                     return {}
                 with self._path.open("r", encoding="utf-8") as handle:
-                    return json.load(handle)
+                    data = json.load(handle)
+                if not isinstance(data, dict):
+                    raise ValueError("profile file does not contain a JSON object")
+                self._cached = data
+                return dict(data)
             except Exception as exc:
                 logger.error(
                     "user profile load failed",
@@ -70,6 +86,8 @@ class UserProfile:
             try:
                 if self._path.exists():
                     self._path.unlink()
+                self._cached = None
+                self._version += 1
             except Exception as exc:
                 logger.warning(
                     "user profile clear failed", extra={"error": str(exc), "path": str(self._path)}
@@ -1,4 +1,5 @@
-from .responses import error_response
+from .json_utils import safe_json_dump
+from .responses import OrjsonResponse, error_response
 from .timezones import (
     UTC,
     convert_to_user_timezone,
@@ -8,7 +9,9 @@ from .timezones import (
 )
 
 __all__ = [
+    "OrjsonResponse",
     "error_response",
+    "safe_json_dump",
     "UTC",
     "convert_to_user_timezone",
     "get_user_timezone_name",
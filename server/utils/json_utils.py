@@ -0,0 +1,21 @@
+"""JSON serialization helpers backed by orjson."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+_DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def safe_json_dump(payload: Any) -> str:
+    """Serialize payload to JSON, falling back to ``str`` on failure."""
+
+    try:
+        return orjson.dumps(payload, default=str, option=_DUMP_OPTIONS).decode("utf-8")
+    except (TypeError, ValueError):
+        return str(payload)
+
+
+__all__ = ["safe_json_dump"]
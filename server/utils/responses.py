@@ -1,13 +1,21 @@
 """Response utilities."""
 
-from typing import Optional
+from typing import Any, Optional
 
+import orjson
 from fastapi.responses import JSONResponse
 
 
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson, stringifying values it cannot encode."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 def error_response(message: str, *, status_code: int, detail: Optional[str] = None) -> JSONResponse:
     """Create a standardized error response."""
     payload = {"ok": False, "error": message}
     if detail:
         payload["detail"] = detail
-    return JSONResponse(payload, status_code=status_code)
\ No newline at end of file
+    return OrjsonResponse(payload, status_code=status_code)